@@ -33,7 +33,8 @@ echo "===================="
 echo ""
 echo "Step 1/3: Scraping species data..."
 cd spider
-uv run scrapy crawl species -a species_id=$SPECIES_ID
+# Skip the HTTP cache so the import never uses stale pages
+uv run scrapy crawl species -a species_id=$SPECIES_ID -s HTTPCACHE_ENABLED=False
 cd ..
 
 # Step 2: Generate SQL
@@ -2,46 +2,48 @@
 Scrapy Items for Auroville Herbarium data structures
 """
 
-import scrapy
+from dataclasses import dataclass, field
 
 
-class SpeciesItem(scrapy.Item):
+@dataclass(slots=True)
+class SpeciesItem:
     """
     Complete species data structure matching the JSON schema in scraping-plan.md
     """
     # Basic identifiers
-    species_id = scrapy.Field()
-    url = scrapy.Field()
-    scraped_at = scrapy.Field()
+    species_id: int | None = None
+    url: str | None = None
+    scraped_at: str | None = None
 
     # Basic info
-    basic_info = scrapy.Field()  # dict with scientific_name, authority, family, common_names
+    basic_info: dict = field(default_factory=dict)  # dict with scientific_name, authority, family, common_names
 
     # Images
-    images = scrapy.Field()  # dict with main_specimen, dry_herbarium, thumbnail
+    images: dict = field(default_factory=dict)  # dict with main_specimen, dry_herbarium, thumbnail
 
     # Collection metadata
-    collection_metadata = scrapy.Field()  # dict with date, collected_by, gps_coordinates, locality
+    collection_metadata: dict = field(default_factory=dict)  # dict with date, collected_by, gps_coordinates, locality
 
     # Nomenclature
-    nomenclature = scrapy.Field()  # dict with botanical_name, author, family, synonyms, etymology, etc.
+    nomenclature: dict = field(default_factory=dict)  # dict with botanical_name, author, family, synonyms, etymology, etc.
 
     # Description sections
-    description = scrapy.Field()  # dict with habit, leaf, flower, fruit, seed, stem_bark
+    description: dict = field(default_factory=dict)  # dict with habit, leaf, flower, fruit, seed, stem_bark
 
     # Ecology sections
-    ecology = scrapy.Field()  # dict with phenology, reproduction_dispersal, distribution
+    ecology: dict = field(default_factory=dict)  # dict with phenology, reproduction_dispersal, distribution
 
     # Human uses
-    human_uses = scrapy.Field()  # dict with culinary, veterinary, others
+    human_uses: dict = field(default_factory=dict)  # dict with culinary, veterinary, others
 
     # Conservation
-    conservation = scrapy.Field()  # dict with status, reforestation
+    conservation: dict = field(default_factory=dict)  # dict with status, reforestation
 
 
-class ContentSectionItem(scrapy.Item):
+@dataclass(slots=True)
+class ContentSectionItem:
     """
     Reusable item for any content section (description/ecology/uses)
     """
-    text = scrapy.Field()  # HTML text content
-    images = scrapy.Field()  # list of {url, caption} dicts
+    text: str | None = None  # HTML text content
+    images: list = field(default_factory=list)  # list of {url, caption} dicts
@@ -3,6 +3,9 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
 from scrapy import signals
 
 # useful for handling different item types with a single interface
@@ -98,3 +101,57 @@ class CrawlerDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class RetryAfterMiddleware:
+    """
+    Slow down a download slot when the server asks us to (429/503 with Retry-After).
+
+    Runs before RetryMiddleware (550) sees the response, so the retry it
+    schedules waits out the slot's new delay. AutoThrottle then eases the
+    delay back down as normal responses come in.
+    """
+
+    RETRY_AFTER_CODES = (429, 503)
+
+    def __init__(self, crawler, max_delay):
+        self.crawler = crawler
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        max_delay = crawler.settings.getfloat('RETRY_AFTER_MAX_DELAY', 60)
+        return cls(crawler, max_delay)
+
+    def process_response(self, request, response, spider):
+        if response.status not in self.RETRY_AFTER_CODES:
+            return response
+
+        delay = self._parse_retry_after(response.headers.get(b'Retry-After'))
+        if delay is None:
+            return response
+        delay = min(delay, self.max_delay)
+
+        downloader = self.crawler.engine.downloader
+        slot_key = downloader.get_slot_key(request)
+        slot = downloader.slots.get(slot_key)
+        if slot is not None and slot.delay < delay:
+            spider.logger.info(f"Retry-After {delay:.0f}s from {request.url} - slot {slot_key} delay raised")
+            slot.delay = delay
+        return response
+
+    @staticmethod
+    def _parse_retry_after(value):
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+        if not value:
+            return None
+        value = value.decode('latin-1').strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -4,10 +4,93 @@ Item Pipelines for Auroville Herbarium Spider
 Handles aggregation of species data from multiple page requests
 """
 
-from itemadapter import ItemAdapter
-from collections import defaultdict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import partial
+import json
 import logging
+import os
+from pathlib import Path
+import time
+from scrapy import signals
+from scrapy.exceptions import DropItem
 from scrapy.exporters import JsonItemExporter
+from crawler.items import SpeciesItem
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write_file(path, data):
+    """Atomically replace path with data (runs on the I/O thread)"""
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _apply_status_event(status, event):
+    """Apply one status-log event to a {'completed': ..., 'failed': ...} status dict"""
+    species_id = event['species_id']
+    if event['event'] == 'completed':
+        status['completed'][species_id] = event['data']
+        # Remove from failed if it was there
+        status['failed'].pop(species_id, None)
+    elif event['event'] == 'failed':
+        status['failed'][species_id] = event['data']
+    elif event['event'] == 'revoked':
+        # Species file could not be written after all
+        status['completed'].pop(species_id, None)
+
+
+def load_scraping_status(output_dir, logger):
+    """
+    Load scraping status: the last _scraping_status.json snapshot,
+    then the events appended to _scraping_status.jsonl since it was written
+    """
+    output_dir = Path(output_dir)
+    status = {'completed': {}, 'failed': {}}
+
+    snapshot = output_dir / '_scraping_status.json'
+    if snapshot.exists():
+        try:
+            with open(snapshot, 'r', encoding='utf-8') as f:
+                status = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load status file: {e}")
+
+    log = output_dir / '_scraping_status.jsonl'
+    if log.exists():
+        with open(log, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    _apply_status_event(status, json.loads(line))
+                except (ValueError, KeyError):
+                    # A crash can leave a truncated last line
+                    logger.warning(f"Skipping unreadable status log line: {line[:80]!r}")
+    return status
+
+
+def find_pipeline(crawler, pipeline_cls):
+    """Return the crawler's enabled instance of pipeline_cls, or None"""
+    try:
+        middlewares = crawler.engine.scraper.itemproc.middlewares
+    except AttributeError:
+        return None
+    return next((p for p in middlewares if isinstance(p, pipeline_cls)), None)
 
 
 class SingleObjectJsonItemExporter(JsonItemExporter):
@@ -36,8 +119,25 @@ class SingleObjectJsonItemExporter(JsonItemExporter):
 
         # Write the item as a plain object (not in an array)
         itemdict = dict(self._get_serialized_fields(item))
-        data = self.encoder.encode(itemdict) + '\n'
-        self.file.write(data.encode('utf-8'))
+        if orjson is not None and self.encoding == 'utf-8':
+            # orjson only emits UTF-8; the Scrapy encoder still handles types orjson doesn't know
+            option = orjson.OPT_INDENT_2 if self.indent else 0
+            self.file.write(orjson.dumps(itemdict, default=self.encoder.default, option=option) + b'\n')
+        else:
+            data = self.encoder.encode(itemdict) + '\n'
+            self.file.write(data.encode('utf-8'))
+
+
+@dataclass(slots=True)
+class _SpeciesState:
+    """Aggregation state for one in-flight species"""
+    cached: dict  # Partial species data merged so far
+    pending: set  # Section keys still waiting for data
+    first_seen: float  # time.monotonic() when we first saw this species (for timeout)
+    expected: int  # Expected responses (dynamic based on menu)
+    completed: int = 0  # Sections received with data
+    responses: int = 0  # Total responses received (including empty/failed sections)
+    timer: object = None  # reactor.callLater handle that fires the timeout without a new item
 
 
 class SpeciesAggregationPipeline:
@@ -45,29 +145,37 @@ class SpeciesAggregationPipeline:
     Aggregates species data from multiple page requests into a single complete item
     """
 
-    def __init__(self):
-        # Cache to store partial species data by species_id
-        self.species_cache = defaultdict(dict)
-        # Track which requests are pending for each species
-        self.pending_sections = defaultdict(set)
-        # Track completed sections count
-        self.completed_sections = defaultdict(int)
-        # Track total responses received (including empty/failed sections)
-        self.responses_received = defaultdict(int)
-        # Track when we first saw each species (for timeout)
-        self.first_seen = {}
-        # Track expected sections per species (dynamic based on menu)
-        self.expected_per_species = {}
+    def __init__(self, completed_cap=4096, max_in_flight=32):
+        # Aggregation state for each in-flight species, by species_id (oldest first)
+        self.states: dict[int, _SpeciesState] = {}
+        # Cap on species aggregated at once; the oldest is finished early to make room
+        self._max_in_flight = max_in_flight
         # Track species that have been completed or failed (to ignore late responses)
-        self._completed_species = set()
+        # Bounded LRU - late responses can only come from requests still in flight.
+        # Exact membership matters: a false positive would drop every item of a new species.
+        self._completed_species: OrderedDict[int, None] = OrderedDict()
+        self._completed_cap = completed_cap
+        # IncrementalSavingPipeline used for status tracking (resolved at open_spider)
+        self._inc_pipeline = None
         # Default total expected sections if not specified
         self.default_total_expected = 15  # 6 description + 3 ecology + 4 human_uses + 2 conservation + 1 nomenclature
+        # Seconds to wait for a species' remaining sections
+        self.timeout = 60
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @classmethod
+    def from_crawler(cls, crawler):
+        # How many finished species to remember for dropping late responses
+        completed_cap = crawler.settings.getint('COMPLETED_SPECIES_CACHE_SIZE', 4096)
+        # How many species may hold partial aggregation state at once
+        max_in_flight = crawler.settings.getint('MAX_IN_FLIGHT_SPECIES', 32)
+        return cls(completed_cap, max_in_flight)
+
     def open_spider(self, spider):
         """Initialize when spider opens"""
         if spider.name == 'species':
             self.logger.info("Species aggregation pipeline initialized")
+            self._inc_pipeline = find_pipeline(spider.crawler, IncrementalSavingPipeline)
             # Define expected sections
             self.expected_sections = {
                 'description': set(['habit', 'leaf', 'flower', 'fruit', 'seed', 'stem_bark']),
@@ -76,6 +184,12 @@ class SpeciesAggregationPipeline:
                 'conservation': set(['status', 'reforestation']),
                 'nomenclature': set(['_complete'])  # Special marker for nomenclature
             }
+            # Pending-set keys by (section, subsection), so they aren't rebuilt per item
+            self._section_keys = {
+                (section, sub): f"{section}.{sub}"
+                for section, subs in self.expected_sections.items()
+                for sub in subs
+            }
 
     def process_item(self, item, spider):
         """
@@ -86,36 +200,37 @@ class SpeciesAggregationPipeline:
         if spider.name != 'species':
             return item
 
-        species_id = item.get('species_id')
+        species_id = getattr(item, 'species_id', None)
         if not species_id:
             return item
 
         # If this species was already completed or failed, silently drop
-        if species_id not in self.species_cache:
-            # Check if we already yielded/failed this species
-            if species_id in getattr(self, '_completed_species', set()):
-                from scrapy.exceptions import DropItem
-                raise DropItem(f"Species {species_id} already completed/failed")
-
-        # Initialize cache for this species if needed
-        if species_id not in self.species_cache:
-            from datetime import datetime
+        # (checked first so late responses never touch the aggregation state)
+        if species_id in self._completed_species:
+            raise DropItem(f"Species {species_id} already completed/failed")
+
+        # Initialize state for this species if needed
+        st = self.states.get(species_id)
+        if st is None:
+            # Bound memory: finish the oldest species before starting another
+            while len(self.states) >= self._max_in_flight:
+                evicted = self._force_timeout(
+                    next(iter(self.states)), spider,
+                    f"In-flight limit ({self._max_in_flight}) reached", 'evicted_insufficient_data'
+                )
+                if evicted:
+                    self._emit_item(evicted, spider)
 
-            self.species_cache[species_id] = {
+            cached_item = {
                 'species_id': species_id,
-                'url': item.get('url'),
-                'scraped_at': item.get('scraped_at'),
-                'basic_info': item.get('basic_info', {}),
-                'images': item.get('images', {}),
-                'collection_metadata': item.get('collection_metadata', {}),
-                'nomenclature': {},
-                'description': {},
-                'ecology': {},
-                'human_uses': {},
-                'conservation': {},
+                'url': item.url,
+                'scraped_at': item.scraped_at,
+                'basic_info': item.basic_info,
+                'images': item.images,
+                'collection_metadata': item.collection_metadata,
+                # Section dicts are created when they first get data;
+                # SpeciesItem's defaults fill in the rest when the item is yielded
             }
-            # Track when we first saw this species
-            self.first_seen[species_id] = datetime.now()
 
             # Get available sections from spider (if it detected them from menu)
             # Otherwise fall back to expecting all sections
@@ -123,138 +238,89 @@ class SpeciesAggregationPipeline:
 
             if available_sections:
                 # Only track sections that are actually available for this species
-                self.pending_sections[species_id] = available_sections.copy()
-                self.expected_per_species[species_id] = len(available_sections)
-                self.logger.info(f"Species {species_id}: Expecting {self.expected_per_species[species_id]} sections based on menu")
+                pending = available_sections.copy()
+                expected = len(available_sections)
+                self.logger.info(f"Species {species_id}: Expecting {expected} sections based on menu")
             else:
                 # Fall back to default: track all possible sections
-                for section, subsections in self.expected_sections.items():
-                    self.pending_sections[species_id].update(
-                        [f"{section}.{sub}" for sub in subsections]
-                    )
-                self.expected_per_species[species_id] = self.default_total_expected
+                pending = {
+                    f"{section}.{sub}"
+                    for section, subsections in self.expected_sections.items()
+                    for sub in subsections
+                }
+                expected = self.default_total_expected
+
+            st = self.states[species_id] = _SpeciesState(
+                cached=cached_item,
+                pending=pending,
+                first_seen=time.monotonic(),
+                expected=expected,
+            )
+            # Fire the timeout even if no further responses arrive for this species
+            from twisted.internet import reactor  # the reactor Scrapy installed
+
+            st.timer = reactor.callLater(self.timeout, self._check_timeout, species_id, spider)
 
         # Update the cache with new data
-        cached_item = self.species_cache[species_id]
+        cached_item = st.cached
 
         # Increment responses received (we got SOME response for this species)
-        self.responses_received[species_id] += 1
+        st.responses += 1
 
         # Update sections that have data
         for section in ['description', 'ecology', 'human_uses', 'conservation']:
-            if item.get(section):
-                for subsection, data in item[section].items():
-                    cached_item[section][subsection] = data
+            section_data = getattr(item, section)
+            if section_data:
+                cached_item.setdefault(section, {}).update(section_data)
+                for subsection in section_data:
                     # Mark this section as complete
-                    section_key = f"{section}.{subsection}"
-                    if section_key in self.pending_sections[species_id]:
-                        self.pending_sections[species_id].remove(section_key)
-                        self.completed_sections[species_id] += 1
+                    section_key = self._section_keys.get((section, subsection))
+                    if section_key is None:
+                        # Subsection outside expected_sections (e.g. medicinal) - build its key once
+                        section_key = self._section_keys[(section, subsection)] = f"{section}.{subsection}"
+                    if section_key in st.pending:
+                        st.pending.remove(section_key)
+                        st.completed += 1
                         self.logger.debug(f"Species {species_id}: Completed {section_key}")
 
         # Handle nomenclature (single page)
-        if item.get('nomenclature') and item['nomenclature']:
-            cached_item['nomenclature'] = item['nomenclature']
+        if item.nomenclature:
+            cached_item['nomenclature'] = item.nomenclature
             section_key = "nomenclature._complete"
-            if section_key in self.pending_sections[species_id]:
-                self.pending_sections[species_id].remove(section_key)
-                self.completed_sections[species_id] += 1
+            if section_key in st.pending:
+                st.pending.remove(section_key)
+                st.completed += 1
                 self.logger.debug(f"Species {species_id}: Completed nomenclature")
 
         # Check if we should yield
-        # Yield if: all sections complete OR we've received all expected responses OR timeout with enough data
-        completed_count = self.completed_sections[species_id]
-        responses_count = self.responses_received[species_id]
-        total_expected = self.expected_per_species.get(species_id, self.default_total_expected)
-        min_responses = max(2, int(total_expected * 0.6))  # At least 60% of expected responses
+        # Yield if: all sections complete OR we've received all expected responses
+        # (on timeout _force_timeout saves it if it has at least 60% of the expected responses)
+        completed_count = st.completed
+        responses_count = st.responses
+        total_expected = st.expected
 
         # Check if we've been waiting too long (timeout after 60 seconds)
-        from datetime import datetime, timedelta
-        time_waiting = (datetime.now() - self.first_seen[species_id]).total_seconds()
-        timed_out = time_waiting > 60
+        time_waiting = time.monotonic() - st.first_seen
+        timed_out = time_waiting > self.timeout
 
-        if not self.pending_sections[species_id]:
+        if not st.pending:
             # All sections complete
             self.logger.info(f"Species {species_id}: All {completed_count} sections complete, yielding item")
-            complete_item = self.species_cache.pop(species_id)
-            del self.pending_sections[species_id]
-            del self.completed_sections[species_id]
-            del self.responses_received[species_id]
-            del self.first_seen[species_id]
-            del self.expected_per_species[species_id]
-            self._completed_species.add(species_id)
-            return complete_item
+            return self._finalize(species_id, spider)
         elif responses_count >= total_expected:
             # Received all expected responses (even if some sections are missing/empty)
             self.logger.info(
                 f"Species {species_id}: Received all {total_expected} responses "
                 f"({completed_count} with data, {total_expected - completed_count} empty/missing), yielding item"
             )
-            complete_item = self.species_cache.pop(species_id)
-            del self.pending_sections[species_id]
-            del self.completed_sections[species_id]
-            del self.responses_received[species_id]
-            del self.first_seen[species_id]
-            del self.expected_per_species[species_id]
-            self._completed_species.add(species_id)
-            return complete_item
-        elif responses_count >= min_responses and timed_out:
-            # We have enough data and we've waited long enough - yield what we have
-            self.logger.warning(
-                f"Species {species_id}: Timeout after {time_waiting:.0f}s with {responses_count}/{total_expected} responses "
-                f"({completed_count} with data). Yielding partial item."
-            )
-            complete_item = self.species_cache.pop(species_id)
-            del self.pending_sections[species_id]
-            del self.completed_sections[species_id]
-            del self.responses_received[species_id]
-            del self.first_seen[species_id]
-            del self.expected_per_species[species_id]
-            self._completed_species.add(species_id)
-            return complete_item
-        elif timed_out and responses_count < min_responses:
-            # Timeout but not enough data - mark as failed
-            self.logger.error(
-                f"Species {species_id}: Timeout after {time_waiting:.0f}s with only {responses_count}/{total_expected} responses "
-                f"({completed_count} with data). Insufficient data - marking as failed."
+            return self._finalize(species_id, spider)
+        elif timed_out:
+            # Waited long enough - yield what we have if it's enough, otherwise mark as failed
+            partial_item = self._force_timeout(
+                species_id, spider, f"Timeout after {time_waiting:.0f}s", 'timeout_insufficient_data'
             )
-            # Try to get the IncrementalSavingPipeline to mark as failed
-            try:
-                if hasattr(spider, 'crawler'):
-                    pipeline = spider.crawler.engine.scraper.itemproc.middlewares[1]
-                    if hasattr(pipeline, 'mark_failed'):
-                        pipeline.mark_failed(
-                            species_id,
-                            error_type='timeout_insufficient_data',
-                            error_msg=f'Timeout after {time_waiting:.0f}s',
-                            retryable=True,
-                            responses_received=responses_count,
-                            responses_expected=total_expected,
-                            missing_sections=self.pending_sections[species_id]
-                        )
-            except Exception as e:
-                self.logger.error(f"Failed to mark species as failed: {e}")
-
-            # Clean up this species from cache
-            self.species_cache.pop(species_id, None)
-            self.pending_sections.pop(species_id, None)
-            self.completed_sections.pop(species_id, None)
-            self.responses_received.pop(species_id, None)
-            self.first_seen.pop(species_id, None)
-            self.expected_per_species.pop(species_id, None)
-            self._completed_species.add(species_id)
-
-            # Trigger next species since this one failed
-            # Get the IncrementalSavingPipeline to trigger next
-            if hasattr(spider, 'crawler'):
-                try:
-                    inc_pipeline = spider.crawler.engine.scraper.itemproc.middlewares[1]
-                    if hasattr(inc_pipeline, '_trigger_next_species'):
-                        inc_pipeline._trigger_next_species(spider)
-                except Exception as e:
-                    self.logger.error(f"Failed to trigger next species: {e}")
-
-            from scrapy.exceptions import DropItem
+            if partial_item:
+                return partial_item
             raise DropItem(f"Insufficient data for species {species_id} after timeout")
         else:
             # Still waiting
@@ -263,46 +329,122 @@ class SpeciesAggregationPipeline:
                 f"({completed_count} with data), waiting {time_waiting:.0f}s..."
             )
             # Don't yield yet - drop this partial item silently
-            from scrapy.exceptions import DropItem
             raise DropItem(f"Partial item for species {species_id}")
 
+    def _check_timeout(self, species_id, spider):
+        """Timer callback: finish a species whose remaining sections never arrived"""
+        st = self.states.get(species_id)
+        if st is None:
+            return
+        st.timer = None
+        item = self._force_timeout(
+            species_id, spider,
+            f"Timeout after {time.monotonic() - st.first_seen:.0f}s", 'timeout_insufficient_data'
+        )
+        if item:
+            self._emit_item(item, spider)
+
+    def _emit_item(self, item, spider):
+        """Save an item finished outside process_item and report it like the engine would (feeds, stats)"""
+        if self._inc_pipeline:
+            self._inc_pipeline.process_item(item, spider)
+        spider.crawler.signals.send_catch_log_deferred(
+            signals.item_scraped, item=item, response=None, spider=spider
+        )
+
+    def finish_stalled(self, species_id, spider):
+        """Finish a species with no requests left (called from the spider when idle); False if not aggregating it"""
+        if species_id not in self.states:
+            return False
+        item = self._force_timeout(species_id, spider, "Stalled with no requests left", 'stalled_insufficient_data')
+        if item:
+            self._emit_item(item, spider)
+        return True
+
+    def _force_timeout(self, species_id, spider, reason, error_type):
+        """
+        Finish a species early: return its partial item if it has enough responses,
+        otherwise mark it failed and return None
+        """
+        st = self.states[species_id]
+        min_responses = max(2, int(st.expected * 0.6))
+
+        if st.responses >= min_responses:
+            self.logger.warning(
+                f"Species {species_id}: {reason} with {st.responses}/{st.expected} responses "
+                f"({st.completed} with data). Saving partial item."
+            )
+            return self._finalize(species_id, spider)
+        else:
+            self.logger.error(
+                f"Species {species_id}: {reason} with only {st.responses}/{st.expected} responses "
+                f"({st.completed} with data). Insufficient data - marking as failed."
+            )
+            if self._inc_pipeline:
+                try:
+                    self._inc_pipeline.mark_failed(
+                        species_id,
+                        error_type=error_type,
+                        error_msg=reason,
+                        retryable=True,
+                        responses_received=st.responses,
+                        responses_expected=st.expected,
+                        missing_sections=st.pending
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to mark species as failed: {e}")
+            self._finalize(species_id, spider)
+            return None
+
+    def _finalize(self, species_id, spider):
+        """Drop a species' aggregation state and return its aggregated item"""
+        st = self.states.pop(species_id, None)
+        if st and st.timer and st.timer.active():
+            st.timer.cancel()
+        self._mark_completed(species_id)
+        # Let the spider start its next species
+        if hasattr(spider, 'release_species'):
+            spider.release_species(species_id)
+        return SpeciesItem(**st.cached) if st else None
+
+    def _mark_completed(self, species_id):
+        """Remember a finished species, evicting the oldest beyond the cap"""
+        self._completed_species[species_id] = None
+        self._completed_species.move_to_end(species_id)
+        while len(self._completed_species) > self._completed_cap:
+            self._completed_species.popitem(last=False)
+
     def close_spider(self, spider):
         """Cleanup when spider closes"""
         if spider.name == 'species':
             # Log any incomplete species that were cached but not yielded
-            if self.species_cache:
+            if self.states:
                 self.logger.warning(
-                    f"Spider closing with {len(self.species_cache)} incomplete species - they were not yielded"
+                    f"Spider closing with {len(self.states)} incomplete species - they were not yielded"
                 )
-                # Try to get the IncrementalSavingPipeline to mark them as failed
+                # Mark them as failed in the IncrementalSavingPipeline's status tracking
                 try:
-                    from scrapy.utils.project import get_project_settings
-                    settings = get_project_settings()
-
-                    # Access the IncrementalSavingPipeline through crawler
-                    if hasattr(spider, 'crawler'):
-                        pipeline = spider.crawler.engine.scraper.itemproc.middlewares[1]
-
-                        for species_id in list(self.species_cache.keys()):
-                            missing = self.pending_sections.get(species_id, set())
-                            responses = self.responses_received.get(species_id, 0)
+                    for species_id, st in self.states.items():
+                        if st.timer and st.timer.active():
+                            st.timer.cancel()
+                        missing = st.pending
+                        responses = st.responses
+
+                        self.logger.warning(
+                            f"Species {species_id} incomplete - {responses} responses, missing {len(missing)} sections: "
+                            f"{list(missing)[:5]}..."
+                        )
 
-                            self.logger.warning(
-                                f"Species {species_id} incomplete - {responses} responses, missing {len(missing)} sections: "
-                                f"{list(missing)[:5]}..."
+                        if self._inc_pipeline:
+                            self._inc_pipeline.mark_failed(
+                                species_id,
+                                error_type='incomplete_on_close',
+                                error_msg=f'Spider closed before completion',
+                                retryable=True,
+                                responses_received=responses,
+                                responses_expected=st.expected,
+                                missing_sections=missing
                             )
-
-                            # Mark as failed in status tracking
-                            if hasattr(pipeline, 'mark_failed'):
-                                pipeline.mark_failed(
-                                    species_id,
-                                    error_type='incomplete_on_close',
-                                    error_msg=f'Spider closed before completion',
-                                    retryable=True,
-                                    responses_received=responses,
-                                    responses_expected=self.total_expected,
-                                    missing_sections=missing
-                                )
                 except Exception as e:
                     self.logger.error(f"Failed to mark incomplete species as failed: {e}")
 
@@ -311,32 +453,62 @@ class SpeciesAggregationPipeline:
 
 class IncrementalSavingPipeline:
     """
-    Saves each complete species to individual JSON file immediately
+    Saves each complete species to individual JSON file in batches
     Tracks scraping status to enable smart resume functionality
+
+    Species are buffered until buffer_size of them are waiting or flush_interval
+    seconds pass, then written together; a species is only marked completed once
+    its batch is written. Status changes are appended to _scraping_status.jsonl as
+    they happen and compacted into the _scraping_status.json snapshot when the
+    spider closes.
     """
 
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, output_format='files', buffer_size=25, flush_interval=60):
         self.output_dir = output_dir
+        # 'files' writes species-<id>.json per species; 'jsonl' appends to one species.jsonl feed
+        self.output_format = output_format
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer = []  # (species_id, serialized species, has_minimal_data) awaiting the next batch
+        self._flush_timer = None  # reactor.callLater handle that flushes a partial batch
+        self._feed = None
         self.status_file = None
+        self.status_log_file = None
+        self._status_log = None
         self.status_data = {'completed': {}, 'failed': {}}
+        # Pipelines close in reverse order, so earlier pipelines may still report after we close
+        self._closed = False
+        # Files are written on a background thread so the reactor isn't blocked on disk I/O.
+        # A single worker keeps status log lines in order.
+        self._io_pool = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @classmethod
     def from_crawler(cls, crawler):
         # Get output directory from spider settings or use default
         output_dir = crawler.settings.get('INCREMENTAL_OUTPUT_DIR', 'output/species')
-        return cls(output_dir)
+        output_format = crawler.settings.get('INCREMENTAL_OUTPUT_FORMAT', 'files')
+        if output_format not in ('files', 'jsonl'):
+            raise ValueError(f"Unknown INCREMENTAL_OUTPUT_FORMAT: {output_format!r}")
+        return cls(
+            output_dir, output_format,
+            buffer_size=crawler.settings.getint('INCREMENTAL_BUFFER_SIZE', 25),
+            flush_interval=crawler.settings.getfloat('INCREMENTAL_FLUSH_INTERVAL', 60),
+        )
 
     def open_spider(self, spider):
         """Initialize when spider opens"""
-        from pathlib import Path
-
         self.output_dir = Path(self.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='species-io')
+        if self.output_format == 'jsonl':
+            self._feed = open(self.output_dir / 'species.jsonl', 'ab')
 
-        # Status tracking file
+        # Status tracking: snapshot plus append-only event log
         self.status_file = self.output_dir / '_scraping_status.json'
-        self.status_data = self._load_status()
+        self.status_log_file = self.output_dir / '_scraping_status.jsonl'
+        self.status_data = load_scraping_status(self.output_dir, self.logger)
+        self._status_log = open(self.status_log_file, 'ab')
 
         self.logger.info(f"Incremental saving initialized: {self.output_dir}")
         completed = len(self.status_data.get('completed', {}))
@@ -344,47 +516,74 @@ class IncrementalSavingPipeline:
         if completed or failed:
             self.logger.info(f"Previous status: {completed} completed, {failed} failed")
 
-    def _load_status(self):
-        """Load existing scraping status"""
-        import json
+    def _save_status(self):
+        """Save the full scraping status snapshot"""
+        try:
+            self._write(_write_file, self.status_file, _dumps(self.status_data))
+        except Exception as e:
+            self.logger.error(f"Failed to save status file: {e}")
 
-        if self.status_file and self.status_file.exists():
+    def _record(self, event, species_id, data=None):
+        """Apply a status change and append it to the status log"""
+        entry = {'event': event, 'species_id': str(species_id), 'data': data}
+        _apply_status_event(self.status_data, entry)
+        if self._closed:
+            # Log already compacted into the snapshot - keep the snapshot current instead
+            self._save_status()
+        else:
+            self._write(self._append_status, _dumps(entry) + b'\n')
+
+    def _append_status(self, line):
+        """Append one event to the status log (runs on the I/O thread)"""
+        self._status_log.write(line)
+        self._status_log.flush()
+
+    def _append_feed(self, lines):
+        """Append species lines to the jsonl feed (runs on the I/O thread)"""
+        self._feed.write(lines)
+        # On disk before the completed events queued after it are logged
+        self._feed.flush()
+
+    def _write(self, fn, *args, species_ids=()):
+        """Run a write on the I/O thread (inline once the pool is shut down)"""
+        if self._io_pool is None:
             try:
-                with open(self.status_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                fn(*args)
             except Exception as e:
-                self.logger.error(f"Failed to load status file: {e}")
-        return {'completed': {}, 'failed': {}}
+                self._write_failed(species_ids, e)
+            return
+        future = self._io_pool.submit(fn, *args)
+        future.add_done_callback(partial(self._write_done, species_ids))
 
-    def _save_status(self):
-        """Save scraping status"""
-        import json
-        from datetime import datetime
+    def _write_done(self, species_ids, future):
+        """Report a failed background write back on the reactor thread"""
+        exc = future.exception()
+        if exc is not None:
+            from twisted.internet import reactor  # the reactor Scrapy installed
 
-        try:
-            with open(self.status_file, 'w', encoding='utf-8') as f:
-                json.dump(self.status_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.logger.error(f"Failed to save status file: {e}")
+            reactor.callFromThread(self._write_failed, species_ids, exc)
+
+    def _write_failed(self, species_ids, exc):
+        """Log a failed write; species whose data wasn't written are marked failed"""
+        if not species_ids:
+            self.logger.error(f"Failed to save status file: {exc}")
+            return
+        for species_id in species_ids:
+            self.logger.error(f"✗ Failed to save species {species_id}: {exc}")
+            self._record('revoked', species_id)
+            self.mark_failed(species_id, error_type='write_error', error_msg=str(exc), retryable=True)
 
     def _mark_success(self, species_id, has_minimal_data=True):
         """Mark species as successfully scraped"""
-        from datetime import datetime
-
-        self.status_data['completed'][str(species_id)] = {
+        self._record('completed', species_id, {
             'timestamp': datetime.now().isoformat(),
             'status': 'success',
             'has_minimal_data': has_minimal_data
-        }
-        # Remove from failed if it was there
-        self.status_data['failed'].pop(str(species_id), None)
-        self._save_status()
+        })
 
     def mark_failed(self, species_id, error_type='unknown', error_msg='', retryable=True,
                     responses_received=None, responses_expected=None, missing_sections=None):
         """Mark species as failed (called from spider on errors)"""
-        from datetime import datetime
-
         failure_data = {
             'timestamp': datetime.now().isoformat(),
             'error_type': error_type,
@@ -400,71 +599,81 @@ class IncrementalSavingPipeline:
         if missing_sections is not None:
             failure_data['missing_sections'] = list(missing_sections) if isinstance(missing_sections, set) else missing_sections
 
-        self.status_data['failed'][str(species_id)] = failure_data
-        self._save_status()
+        self._record('failed', species_id, failure_data)
 
     def process_item(self, item, spider):
-        """Save complete species to individual file and track status"""
+        """Buffer a complete species for the next batch write"""
         if spider.name != 'species':
             return item
 
-        species_id = item.get('species_id')
+        species_id = getattr(item, 'species_id', None)
         if not species_id:
             return item
 
-        # Generate filename: species-1.json, species-172.json, etc.
-        filename = f"species-{species_id}.json"
-        filepath = self.output_dir / filename
-
-        # Write to file immediately
-        import json
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(dict(item), f, indent=2, ensure_ascii=False)
-
-            # Check if species has minimal data (not just empty structure)
-            has_data = bool(item.get('basic_info', {}).get('scientific_name') or
-                          item.get('description') or
-                          item.get('nomenclature'))
-
-            # Mark as successfully scraped
-            self._mark_success(species_id, has_minimal_data=has_data)
-
-            self.logger.info(f"✓ Saved species {species_id} to {filepath}")
-
-            # Trigger next species in queue (if scraping sequentially)
-            self._trigger_next_species(spider)
-
+            if self._feed is not None:
+                data = _dumps({'species_id': species_id, 'data': asdict(item)}) + b'\n'
+            else:
+                data = _dumps(asdict(item), indent=True)
         except Exception as e:
             self.logger.error(f"✗ Failed to save species {species_id}: {e}")
             self.mark_failed(species_id, error_type='write_error', error_msg=str(e), retryable=True)
+            return item
 
-        return item
-
-    def _trigger_next_species(self, spider):
-        """Trigger the next species in the queue to start scraping"""
-        if not hasattr(spider, 'species_queue'):
-            return
+        # Check if species has minimal data (not just empty structure)
+        has_data = bool(item.basic_info.get('scientific_name') or
+                      item.description or
+                      item.nomenclature)
+        self._buffer.append((species_id, data, has_data))
 
-        spider.current_species_index = getattr(spider, 'current_species_index', 0) + 1
+        if self._closed or len(self._buffer) >= self.buffer_size:
+            self._flush()
+        elif self._flush_timer is None and self.flush_interval > 0:
+            from twisted.internet import reactor  # the reactor Scrapy installed
 
-        if spider.current_species_index < len(spider.species_queue):
-            import scrapy
-            from scrapy.http import Request
+            self._flush_timer = reactor.callLater(self.flush_interval, self._flush)
 
-            link = spider.species_queue[spider.current_species_index]
-            self.logger.info(f"Starting next species ({spider.current_species_index + 1}/{len(spider.species_queue)})")
+        return item
 
-            # Use response.follow() logic to properly handle relative URLs
-            # The links from menu are like "herbarium.php?id=365" (relative)
-            full_url = spider.base_url + '/' + link if not link.startswith('http') else link
+    def _flush(self):
+        """Queue the buffered species as one batch, then mark them completed"""
+        if self._flush_timer is not None and self._flush_timer.active():
+            self._flush_timer.cancel()
+        self._flush_timer = None
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
 
-            request = Request(
-                full_url,
-                callback=spider.parse_species_index,
-                dont_filter=True
+        # Failures are reported back by _write_failed, which revokes the completed mark
+        if self._feed is not None:
+            self._write(
+                self._append_feed, b''.join(data for _, data, _ in batch),
+                species_ids=tuple(species_id for species_id, _, _ in batch)
             )
-            spider.crawler.engine.crawl(request)
+        else:
+            for species_id, data, _ in batch:
+                # Generate filename: species-1.json, species-172.json, etc.
+                filepath = self.output_dir / f"species-{species_id}.json"
+                self._write(_write_file, filepath, data, species_ids=(species_id,))
+
+        for species_id, _, has_data in batch:
+            self._mark_success(species_id, has_minimal_data=has_data)
+        self.logger.info(f"✓ Saved {len(batch)} species: {', '.join(str(species_id) for species_id, _, _ in batch)}")
+
+    def close_spider(self, spider):
+        """Compact the status log into the snapshot; later changes rewrite the snapshot directly"""
+        # Write the last partial batch, wait for queued writes, then write inline from here on
+        self._flush()
+        self._io_pool.shutdown(wait=True)
+        self._io_pool = None
+        self._closed = True
+        if self._feed is not None:
+            self._feed.close()
+
+        self._status_log.close()
+        self._save_status()
+        # The snapshot now holds every logged event (replaying them again would be harmless)
+        self.status_log_file.unlink(missing_ok=True)
 
 
 class CrawlerPipeline:
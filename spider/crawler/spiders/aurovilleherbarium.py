@@ -1,3 +1,5 @@
+from urllib.parse import urldefrag
+
 import scrapy
 
 
@@ -11,6 +13,14 @@ class AhSpider(scrapy.Spider):
         "ROBOTSTXT_OBEY": True,
     }
 
+    # Menu selectors, relative to a menu row
+    XP_MENU_ROWS = "//div[@id='column_plantmenu']"
+    XP_ROW_LINKS = ".//a[contains(@href, 'herbarium.php?id=')]/@href"
+    XP_SCIENTIFIC_NAME = ".//span[@class='latin2']/text()"
+    XP_AUTHORITY = ".//span[@class='latin']/text()"
+    XP_COMMON_NAMES = ".//div[@id='index_plants']//a//br/text()"
+    XP_THUMBNAIL = ".//img[@class='plant_image']/@src"
+
     def parse(self, response):
         """
         Parse the species menu page to extract all individual species page links.
@@ -18,38 +28,48 @@ class AhSpider(scrapy.Spider):
         Each species is in a div with class 'column_plantmenu'
         """
 
-        # Extract all species links (format: herbarium.php?id=123)
-        species_links = response.css('a[href*="herbarium.php?id="]::attr(href)').getall()
-
-        # Get unique links only (each species appears twice - image link and text link)
-        unique_links = list(set(species_links))
-
-        self.logger.info(f"Found {len(unique_links)} unique species pages")
-
-        # Extract species info from the menu page
-        for species_div in response.css('div#column_plantmenu'):
-            # Get the species link
-            species_url = species_div.css('a[href*="herbarium.php?id="]::attr(href)').get()
-
-            if species_url:
-                # Extract species name info from the menu
-                scientific_name = species_div.css('span.latin2::text').get()
-                authority = species_div.css('span.latin::text').get()
-                common_names_raw = species_div.css('div#index_plants a br::text').getall()
-                # Common names come after the <br> tag
-                common_names = [name.strip() for name in common_names_raw if name.strip()]
-
-                # Get thumbnail image
-                thumbnail = species_div.css('img.plant_image::attr(src)').get()
-
-                yield {
-                    "species_url": response.urljoin(species_url),
-                    "scientific_name": scientific_name.strip() if scientific_name else None,
-                    "authority": authority.strip() if authority else None,
-                    "common_names": common_names,
-                    "thumbnail_url": thumbnail,
-                    "source_page": response.url,
-                }
+        # Single pass over the menu rows: each row holds the species links, names and thumbnail
+        # (each species appears twice - image link and text link)
+        link_count = 0
+        seen = {}  # absolute species URL (fragment stripped), in menu order
+
+        for row in response.xpath(self.XP_MENU_ROWS):
+            # Extract species links (format: herbarium.php?id=123)
+            row_links = row.xpath(self.XP_ROW_LINKS).getall()
+            if not row_links:
+                continue
+            link_count += len(row_links)
+
+            species_url = urldefrag(response.urljoin(row_links[0])).url
+            if species_url in seen:
+                continue
+            seen[species_url] = None
+
+            # Extract species name info from the menu
+            scientific_name = row.xpath(self.XP_SCIENTIFIC_NAME).get()
+            authority = row.xpath(self.XP_AUTHORITY).get()
+            common_names_raw = row.xpath(self.XP_COMMON_NAMES).getall()
+            # Common names come after the <br> tag
+            common_names = list(filter(None, map(str.strip, common_names_raw)))
+
+            # Get thumbnail image
+            thumbnail = row.xpath(self.XP_THUMBNAIL).get()
+
+            yield {
+                "species_url": species_url,
+                "scientific_name": scientific_name.strip() if scientific_name else None,
+                "authority": authority.strip() if authority else None,
+                "common_names": common_names,
+                "thumbnail_url": thumbnail,
+                "source_page": response.url,
+            }
+
+        unique_links = list(seen)
+
+        self.logger.info(
+            f"Found {len(unique_links)} unique species pages "
+            f"({link_count - len(unique_links)} duplicate links skipped)"
+        )
 
         # Optionally: Follow each species link to scrape detailed pages
         # Uncomment below to crawl individual species pages
@@ -11,9 +11,45 @@ Scrapes complete species information including:
 """
 
 import scrapy
-from datetime import datetime
+from lxml import etree
+from scrapy import signals
+from scrapy.exceptions import DontCloseSpider
+from dataclasses import replace
+from datetime import datetime, timezone
+from itertools import islice
+import json
+from pathlib import Path
 import re
+import time
 from crawler.items import SpeciesItem
+from crawler.pipelines import (
+    IncrementalSavingPipeline, SpeciesAggregationPipeline, find_pipeline, load_scraping_status
+)
+
+# Species ID in a species/content page URL (herbarium.php?id=172)
+_ID_RE = re.compile(r"id=(\d+)")
+# Language marker in the Indian names list ("Hindi :", "Tamil :")
+_LANG_RE = re.compile(r"([A-Z][a-z]+)\s*:")
+
+
+def _text_outside_spans(el):
+    """Text nodes under el in document order, except those directly inside a <span> (like //text()[not(parent::span)])"""
+    if el.text and el.tag != "span":
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str):
+            yield from _text_outside_spans(child)
+        if child.tail and el.tag != "span":
+            yield child.tail
+
+
+def _own_text(el):
+    """el's direct text nodes (like el/text())"""
+    if el.text:
+        yield el.text
+    for child in el:
+        if child.tail:
+            yield child.tail
 
 
 class SpeciesSpider(scrapy.Spider):
@@ -23,21 +59,49 @@ class SpeciesSpider(scrapy.Spider):
     # Base URLs
     base_url = "https://aurovilleherbarium.org"
 
-    # Be polite - wait between requests
+    # Let the scheduler run species in parallel; AutoThrottle backs off if the server slows down
     custom_settings = {
-        "DOWNLOAD_DELAY": 3,  # Wait 3 seconds between requests
+        "CONCURRENT_REQUESTS": 16,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 4,
+        "DOWNLOAD_DELAY": 0.5,  # Minimum delay between requests (AutoThrottle never goes below it)
         "RANDOMIZE_DOWNLOAD_DELAY": True,  # Add randomness to avoid patterns
+        "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_START_DELAY": 1,
+        "AUTOTHROTTLE_MAX_DELAY": 30,  # Upper bound when the server is slow
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 2.0,  # Average requests in flight per slot
+        "AUTOTHROTTLE_DEBUG": True,  # Log the delay for every response
+
+        # Species content pages share their own download slot, so they overlap
+        # without eating into the menu/index pages' per-domain concurrency
+        "DOWNLOAD_SLOTS": {
+            "species_sub": {"concurrency": 4, "delay": 0.5, "randomize_delay": True},
+        },
         "ROBOTSTXT_OBEY": False,  # Site doesn't have robots.txt
-        "CONCURRENT_REQUESTS_PER_DOMAIN": 1,  # Sequential requests
+        "DOWNLOAD_TIMEOUT": 30,  # Abandon stuck connections instead of waiting the default 180s
         "RETRY_TIMES": 5,  # Retry failed requests
         "RETRY_HTTP_CODES": [429, 500, 502, 503, 504],
 
         # Allow 429 and 5xx errors to pass through to retry middleware
         "HTTPERROR_ALLOWED_CODES": [429, 500, 502, 503, 504],
 
+        # Back off a download slot for as long as a 429/503 Retry-After header asks
+        "DOWNLOADER_MIDDLEWARES": {
+            "crawler.middlewares.RetryAfterMiddleware": 560,  # Before RetryMiddleware (550) sees the response
+        },
+        "RETRY_AFTER_MAX_DELAY": 60,
+
         # Exponential backoff for retries
         "RETRY_BACKOFF_MULTIPLIER": 0.5,  # Wait 0.5s, 1s, 2s, 4s, 8s between retries
 
+        # Cache pages on disk (.scrapy/httpcache) so re-runs within a week skip the network;
+        # the site sends no caching headers, so DummyPolicy keeps everything until it expires
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_EXPIRATION_SECS": 7 * 24 * 3600,
+        "HTTPCACHE_DIR": "httpcache",
+        "HTTPCACHE_STORAGE": "scrapy.extensions.httpcache.FilesystemCacheStorage",
+        "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.DummyPolicy",
+        "HTTPCACHE_IGNORE_HTTP_CODES": [429, 500, 502, 503, 504],  # Never replay rate limits or server errors
+
         # Incremental saving pipeline
         "ITEM_PIPELINES": {
             "crawler.pipelines.SpeciesAggregationPipeline": 300,  # Aggregates sections
@@ -46,12 +110,106 @@ class SpeciesSpider(scrapy.Spider):
 
         # Configure output directory for incremental saves
         "INCREMENTAL_OUTPUT_DIR": "output/species",
+        # "files" = one species-<id>.json per species (read by scripts/generate-sql.ts),
+        # "jsonl" = append every species to a single species.jsonl
+        "INCREMENTAL_OUTPUT_FORMAT": "files",
+        # Finished species are written in batches of INCREMENTAL_BUFFER_SIZE, or after
+        # INCREMENTAL_FLUSH_INTERVAL seconds for a partial batch (and when the spider closes)
+        "INCREMENTAL_BUFFER_SIZE": 25,
+        "INCREMENTAL_FLUSH_INTERVAL": 60,
+
+        # Finished species remembered to drop late responses (bounds memory on long crawls)
+        "COMPLETED_SPECIES_CACHE_SIZE": 4096,
+
+        # Seconds a saved species list (output/species/_all_species.json) is reused
+        # by resume/retry runs instead of fetching the menu; 0 always fetches it
+        "SPECIES_LIST_TTL": 86400,
+
+        # Species scraped at once; the next one starts as each finishes
+        "SPECIES_PARALLELISM": 3,
+
+        # Species aggregated at once before the oldest is finished early (bounds memory)
+        "MAX_IN_FLIGHT_SPECIES": 32,
 
         "LOG_FILE": "spider.log",  # Write logs to file
         "LOG_FILE_APPEND": False,  # Overwrite log file each run
         "LOG_LEVEL": "INFO",  # INFO, DEBUG, WARNING, ERROR
     }
 
+    # XPath for the per-species selectors (written as XPath to skip the CSS translation step)
+    XP_SPECIES_LINKS = "//a[contains(@href, 'herbarium.php?id=')]/@href"
+    XP_SCIENTIFIC_NAME = "//div[@id='specimen_title']/text()"
+    XP_AUTHORITY = (
+        "//div[@id='specimen_title']//span"
+        "[contains(concat(' ', normalize-space(@class), ' '), ' specimen_title2 ')]/text()"
+    )
+    XP_FAMILY = "//div[@id='specimen_family']/text()"
+    XP_MAIN_SPECIMEN = "//div[@id='specimen_wrapper']//div[@id='specimen_img']//img/@src"
+    XP_DRY_HERBARIUM = "//div[@id='dryherbarium-img']//img/@src"
+    XP_GPS = (
+        "//div[@id='notes_title'][contains(., 'GPS')]"
+        "/following-sibling::*[1][self::div and @id='notes_content']//pre/text()"
+    )
+    # Parameterized with $title - lxml compiles each expression once, whatever the title
+    XP_NOTE_CONTENT = (
+        "//div[@id='notes_title'][contains(text(), $title)]"
+        "/following-sibling::div[@id='notes_content'][1]/text()"
+    )
+
+    # Human uses entries also count when they are the selected page (a span instead of a link)
+    MENU_SELECTABLE_TITLES = ('Medicinal', 'Culinary', 'Handicrafts', 'Veterinary', 'Others')
+    # Species menu: every available entry in one query - it has a link, is selectable and selected,
+    # or is Ecology (listed even without a link); the entries are then matched by (menu id, title) below
+    XP_MENU_AVAILABLE = (
+        "//div[@id='plant_menu' or @id='plant_sousmenu'][.//a or @title='Ecology' or ("
+        + " or ".join(f"@title='{title}'" for title in MENU_SELECTABLE_TITLES)
+        + ") and .//span[contains(concat(' ', normalize-space(@class), ' '), ' subselected ')]]"
+    )
+    # (menu id, title) -> section key
+    MENU_SECTIONS = {
+        ('plant_menu', 'Nomenclature'): 'nomenclature._complete',
+        # Description subsections
+        ('plant_sousmenu', 'Habit'): 'description.habit',
+        ('plant_sousmenu', 'Leaf'): 'description.leaf',
+        ('plant_sousmenu', 'Flower'): 'description.flower',
+        ('plant_sousmenu', 'Fruit'): 'description.fruit',
+        ('plant_sousmenu', 'Seed'): 'description.seed',
+        ('plant_sousmenu', 'Stem'): 'description.stem_bark',
+        # Ecology sections
+        ('plant_menu', 'Phenology'): 'ecology.phenology',
+        ('plant_menu', 'Reproduction'): 'ecology.reproduction_dispersal',
+        ('plant_menu', 'Ecology'): 'ecology.distribution',
+        # Human uses subsections
+        ('plant_sousmenu', 'Medicinal'): 'human_uses.medicinal',
+        ('plant_sousmenu', 'Culinary'): 'human_uses.culinary',
+        ('plant_sousmenu', 'Handicrafts'): 'human_uses.handicrafts',
+        ('plant_sousmenu', 'Veterinary'): 'human_uses.veterinary',
+        ('plant_sousmenu', 'Others'): 'human_uses.others',
+        # Conservation sections
+        ('plant_menu', 'Conservation status'): 'conservation.status',
+        ('plant_menu', 'Reforestation'): 'conservation.reforestation',
+    }
+
+    # Combined ecology-distribution page, by $title ("Ecology" / "Distribution")
+    XP_TITCHAP_P = "//span[@class='titchap' and contains(text(), $title)]/following-sibling::p"
+    XP_TITCHAP_LI = "//span[@class='titchap' and contains(text(), $title)]/parent::li"
+
+    # Nomenclature page: one list item per field, labelled by a titchap span ("Family :")
+    XP_NOMEN_ITEMS = "//li[span[@class='titchap']]"
+
+    # Index-page statuses that fail a species: status -> (error_type, error_msg, retryable).
+    # 5xx responses and bodies under MIN_INDEX_BODY bytes are also retryable failures.
+    STATUS_FAILURES = {
+        404: ('404_permanent', 'Page not found', False),
+        410: ('410_permanent', 'Resource gone', False),
+        403: ('403_permanent', 'Access forbidden', False),
+        429: ('rate_limit', 'Too many requests', True),
+    }
+    MIN_INDEX_BODY = 100
+
+    # Download slot shared by every species' content pages (see DOWNLOAD_SLOTS)
+    SUBPAGE_SLOT = "species_sub"
+
     # Content pages to scrape for each species
     CONTENT_PAGES = {
         "description": {
@@ -90,28 +248,61 @@ class SpeciesSpider(scrapy.Spider):
         # Track available sections per species
         self.available_sections = {}
 
-        # Load scraping status if resume or retry_failed
-        if self.resume or self.retry_failed:
-            self.scraping_status = self._load_scraping_status()
-            completed_count = len(self.scraping_status.get('completed', {}))
-            failed_count = len(self.scraping_status.get('failed', {}))
-            self.logger.info(f"Status: {completed_count} completed, {failed_count} failed")
-        else:
-            self.scraping_status = {'completed': {}, 'failed': {}}
+        # Species still to start (set from the menu) and species currently being scraped
+        self._species_iter = None
+        self._in_flight = set()
+
+        # IncrementalSavingPipeline for failure tracking and SpeciesAggregationPipeline
+        # for finishing stalled species (resolved at spider_opened)
+        self._save_pipeline = None
+        self._aggregation_pipeline = None
+
+        # Index-page data per in-flight species; content-page requests carry only the species_id
+        self._species_cache = {}
+
+        # Content pages as (section, subsection, menu section key, callback, URL template),
+        # nomenclature first, so each species only fills in its ID
+        self._content_requests = [
+            ("nomenclature", "_complete", "nomenclature._complete", self.parse_nomenclature,
+             f"{self.base_url}/contents/nomenclature.php?id=%d"),
+        ]
+        for section, pages in self.CONTENT_PAGES.items():
+            for subsection, page_url in pages.items():
+                if subsection == "ecology_distribution":
+                    # Combined ecology-distribution page, listed in the menu as "Ecology"
+                    section_key, callback = "ecology.distribution", self.parse_ecology_distribution
+                else:
+                    section_key, callback = f"{section}.{subsection}", self.parse_content_page
+                self._content_requests.append(
+                    (section, subsection, section_key, callback, f"{self.base_url}/{page_url}?id=%d")
+                )
+
+        # Scraping status, loaded in from_crawler for resume/retry runs
+        self.scraping_status = {'completed': {}, 'failed': {}}
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+
+        # Load scraping status if resume or retry_failed (needs INCREMENTAL_OUTPUT_DIR from settings)
+        if spider.resume or spider.retry_failed:
+            spider.scraping_status = spider._load_scraping_status()
+            completed_count = len(spider.scraping_status.get('completed', {}))
+            failed_count = len(spider.scraping_status.get('failed', {}))
+            spider.logger.info(f"Status: {completed_count} completed, {failed_count} failed")
+
+        crawler.signals.connect(spider.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(spider.spider_idle, signal=signals.spider_idle)
+        return spider
+
+    def spider_opened(self, spider):
+        """Look up the pipelines used for failure tracking and stalled species once they exist"""
+        self._save_pipeline = find_pipeline(self.crawler, IncrementalSavingPipeline)
+        self._aggregation_pipeline = find_pipeline(self.crawler, SpeciesAggregationPipeline)
 
     def _load_scraping_status(self):
-        """Load scraping status from _scraping_status.json"""
-        from pathlib import Path
-        import json
-
-        status_file = Path('output/species/_scraping_status.json')
-        if status_file.exists():
-            try:
-                with open(status_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                self.logger.error(f"Failed to load status file: {e}")
-        return {'completed': {}, 'failed': {}}
+        """Load scraping status from _scraping_status.json and its _scraping_status.jsonl log"""
+        return load_scraping_status(self._output_dir(), self.logger)
 
     async def start(self):
         """
@@ -135,73 +326,170 @@ class SpeciesSpider(scrapy.Spider):
         if self.species_id:
             # Scrape specific species
             url = f"{self.base_url}/herbarium.php?id={self.species_id}"
-            yield scrapy.Request(url, callback=self.parse_species_index)
+            # Tracked like a windowed species so spider_idle can finish it if it stalls
+            self._in_flight.add(self.extract_species_id(url))
+            yield self._index_request(url)
+            return
+
+        # Resume/retry runs can reuse the species list saved by an earlier run
+        cached_ids = self._load_species_list() if self.resume or self.retry_failed else None
+        if cached_ids is not None:
+            self.logger.info(f"Using {len(cached_ids)} cached species IDs (skipping the menu)")
+            for request in self._start_species(
+                f"{self.base_url}/herbarium.php?id={species_id}" for species_id in cached_ids
+            ):
+                yield request
         else:
-            # Start from species menu to get all IDs
+            # Start from species menu to get all IDs (never from the HTTP cache, so new species show up)
             url = f"{self.base_url}/menu_species.php"
-            yield scrapy.Request(url, callback=self.parse_species_menu)
+            yield scrapy.Request(url, callback=self.parse_species_menu, meta={"dont_cache": True})
+
+    def _output_dir(self):
+        """Directory the saving pipeline writes species and status files to"""
+        return Path(self.settings.get('INCREMENTAL_OUTPUT_DIR', 'output/species'))
+
+    def _load_species_list(self):
+        """Species IDs saved from the menu by an earlier run, or None if missing or older than SPECIES_LIST_TTL"""
+        path = self._output_dir() / '_all_species.json'
+        ttl = self.settings.getint('SPECIES_LIST_TTL', 86400)
+        try:
+            if ttl <= 0 or time.time() - path.stat().st_mtime > ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Failed to load species list: {e}")
+            return None
+
+    def _save_species_list(self, links):
+        """Save the menu's species IDs so resume/retry runs can skip the menu"""
+        path = self._output_dir() / '_all_species.json'
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            species_ids = [species_id for species_id in map(self.extract_species_id, links) if species_id is not None]
+            path.write_text(json.dumps(species_ids), encoding='utf-8')
+        except Exception as e:
+            self.logger.error(f"Failed to save species list: {e}")
 
     def parse_species_menu(self, response):
         """
         Parse the species menu to get all species IDs
-        Store them and start processing one at a time
+        and start the first SPECIES_PARALLELISM species (the rest follow as each finishes)
         """
         # Extract all unique species IDs
-        species_links = response.css(
-            'a[href*="herbarium.php?id="]::attr(href)'
-        ).getall()
-        unique_links = list(set(species_links))
+        species_links = response.xpath(self.XP_SPECIES_LINKS).getall()
+        unique_links = list(dict.fromkeys(species_links))  # dedupe, keeping menu order
 
         self.logger.info(f"Found {len(unique_links)} unique species links")
+        self._save_species_list(unique_links)
 
-        # Filter based on scraping status
-        if self.resume:
-            filtered_links = []
-            completed_ids = set(self.scraping_status.get('completed', {}).keys())
-
-            for link in unique_links:
-                species_id = str(self.extract_species_id(link))
-                if species_id not in completed_ids:
-                    filtered_links.append(link)
-                else:
-                    self.logger.debug(f"Skipping successfully scraped species {species_id}")
-
-            unique_links = filtered_links
-            self.logger.info(f"Resume mode: {len(unique_links)} species remaining to scrape")
+        yield from self._start_species(map(response.urljoin, unique_links))
 
-        # Retry failed species only (but only retryable ones)
+    def _start_species(self, urls):
+        """
+        Filter the species index URLs and start the first SPECIES_PARALLELISM of them
+        (the rest follow as each finishes)
+        """
+        if self.resume:
+            self.logger.info("Resume mode: skipping successfully scraped species")
         if self.retry_failed:
-            filtered_links = []
-            failed_dict = self.scraping_status.get('failed', {})
-
-            for link in unique_links:
-                species_id = str(self.extract_species_id(link))
-                if species_id in failed_dict:
-                    # Only retry if marked as retryable
-                    if failed_dict[species_id].get('retryable', True):
-                        filtered_links.append(link)
-                        self.logger.debug(f"Will retry species {species_id} ({failed_dict[species_id]['error_type']})")
-                    else:
-                        self.logger.debug(f"Skipping permanent failure {species_id} ({failed_dict[species_id]['error_type']})")
-
-            unique_links = filtered_links
-            self.logger.info(f"Retry mode: {len(unique_links)} retryable failures to retry")
+            self.logger.info("Retry mode: only retrying retryable failures")
 
+        species_links = self._species_links(urls)
         # Limit species if max_species is set
         if self.max_species:
-            unique_links = unique_links[:self.max_species]
+            species_links = islice(species_links, self.max_species)
             self.logger.info(f"Limiting to {self.max_species} species")
 
-        self.logger.info(f"Scraping {len(unique_links)} species sequentially")
+        # Links are filtered lazily as the window advances
+        self._species_iter = iter(species_links)
+        parallelism = self.settings.getint('SPECIES_PARALLELISM', 3)
+        self.logger.info(f"Scraping up to {parallelism} species at a time")
+        yield from self._next_species_requests()
 
-        # Store remaining species to scrape
-        self.species_queue = unique_links
-        self.current_species_index = 0
+    def _next_species_requests(self):
+        """Yield index requests until SPECIES_PARALLELISM species are in flight"""
+        if self._species_iter is None:
+            return
+        parallelism = self.settings.getint('SPECIES_PARALLELISM', 3)
+        while len(self._in_flight) < parallelism:
+            url = next(self._species_iter, None)
+            if url is None:
+                self._species_iter = None
+                self.logger.info("All species scheduled")
+                return
+            self._in_flight.add(self.extract_species_id(url))
+            yield self._index_request(url, errback=self.handle_index_error)
+
+    def _index_request(self, url, **kwargs):
+        """Request a species index page, letting the STATUS_FAILURES codes reach parse_species_index"""
+        statuses = {*map(int, self.settings.getlist('HTTPERROR_ALLOWED_CODES')), *self.STATUS_FAILURES}
+        meta = {"handle_httpstatus_list": sorted(statuses)}
+        if str(self.extract_species_id(url)) in self.scraping_status.get('failed', {}):
+            # Failed before (resume or retry run): the HTTP cache may hold the bad response,
+            # e.g. a short 200 body recorded as empty_response - refetch it for real
+            meta["dont_cache"] = True
+        return scrapy.Request(url, callback=self.parse_species_index, meta=meta, **kwargs)
+
+    def release_species(self, species_id):
+        """
+        Called when a species is finished (saved or failed) - start the next one
+        """
+        self._in_flight.discard(species_id)
+        self._species_cache.pop(species_id, None)
+        for request in self._next_species_requests():
+            self.crawler.engine.crawl(request)
 
-        # Start with the first species only
-        if self.species_queue:
-            link = self.species_queue[0]
-            yield response.follow(link, callback=self.parse_species_index)
+    def spider_idle(self):
+        """
+        Safety net: nothing is downloading, so species still marked in flight
+        lost their remaining requests (e.g. their last content page errored out)
+        """
+        stalled = sorted(self._in_flight)
+        if stalled:
+            self.logger.warning(f"Finishing {len(stalled)} stalled species: {stalled}")
+            for species_id in stalled:
+                # Saved or failed like a timeout (releasing it starts the next species);
+                # species the aggregation pipeline never saw are just released
+                if not (self._aggregation_pipeline and self._aggregation_pipeline.finish_stalled(species_id, self)):
+                    self.release_species(species_id)
+        for request in self._next_species_requests():
+            self.crawler.engine.crawl(request)
+        if self._in_flight:
+            raise DontCloseSpider
+
+    def _species_links(self, links):
+        """
+        Lazily yield the species links to scrape, applying resume/retry filtering
+        """
+        # Status keys are strings in JSON; convert once so each link is checked by its int ID
+        # (skipping keys like "None", recorded for responses whose URL had no id=)
+        completed_ids = {int(k) for k in self.scraping_status.get('completed', {}) if k.isdigit()}
+        failed_by_id = {int(k): v for k, v in self.scraping_status.get('failed', {}).items() if k.isdigit()}
+
+        for link in links:
+            species_id = self.extract_species_id(link)
+            if species_id is None:
+                continue
+
+            # Filter based on scraping status
+            if self.resume and species_id in completed_ids:
+                self.logger.debug(f"Skipping successfully scraped species {species_id}")
+                continue
+
+            # Retry failed species only (but only retryable ones)
+            if self.retry_failed:
+                failure = failed_by_id.get(species_id)
+                if failure is None:
+                    continue
+                if not failure.get('retryable', True):
+                    self.logger.debug(f"Skipping permanent failure {species_id} ({failure['error_type']})")
+                    continue
+                self.logger.debug(f"Will retry species {species_id} ({failure['error_type']})")
+
+            yield link
 
     def parse_species_index(self, response):
         """
@@ -210,156 +498,57 @@ class SpeciesSpider(scrapy.Spider):
         # Extract species ID from URL
         species_id = self.extract_species_id(response.url)
 
-        # Get pipeline for error tracking
-        try:
-            pipeline = self.crawler.engine.scraper.itemproc.middlewares[1]  # IncrementalSavingPipeline at 400
-        except (AttributeError, IndexError):
-            pipeline = None
-
-        # Handle permanent failures (don't retry)
-        if response.status == 404:
-            self.logger.warning(f"✗ Species {species_id} not found (404)")
-            if pipeline and hasattr(pipeline, 'mark_failed'):
-                pipeline.mark_failed(species_id, error_type='404_permanent',
-                                   error_msg='Page not found', retryable=False)
-            return
-
-        if response.status == 410:
-            self.logger.warning(f"✗ Species {species_id} gone (410)")
-            if pipeline and hasattr(pipeline, 'mark_failed'):
-                pipeline.mark_failed(species_id, error_type='410_permanent',
-                                   error_msg='Resource gone', retryable=False)
-            return
-
-        if response.status == 403:
-            self.logger.warning(f"✗ Species {species_id} forbidden (403)")
-            if pipeline and hasattr(pipeline, 'mark_failed'):
-                pipeline.mark_failed(species_id, error_type='403_permanent',
-                                   error_msg='Access forbidden', retryable=False)
-            return
-
-        # Handle temporary failures (can retry)
-        if response.status >= 500:
-            self.logger.error(f"✗ Server error for species {species_id} (status {response.status})")
-            if pipeline and hasattr(pipeline, 'mark_failed'):
-                pipeline.mark_failed(species_id, error_type='server_error',
-                                   error_msg=f'HTTP {response.status}', retryable=True)
-            return
-
-        if response.status == 429:
-            self.logger.error(f"✗ Rate limited for species {species_id} (429)")
-            if pipeline and hasattr(pipeline, 'mark_failed'):
-                pipeline.mark_failed(species_id, error_type='rate_limit',
-                                   error_msg='Too many requests', retryable=True)
-            return
-
-        # Check for empty/invalid response
-        if not response.body or len(response.body) < 100:
-            self.logger.error(f"✗ Empty response for species {species_id}")
-            if pipeline and hasattr(pipeline, 'mark_failed'):
-                pipeline.mark_failed(species_id, error_type='empty_response',
-                                   error_msg='Response body too small', retryable=True)
+        # Permanent (404/410/403) and temporary (429, 5xx, empty body) failures end this species
+        failure = self.STATUS_FAILURES.get(response.status)
+        if failure is None and response.status >= 500:
+            failure = ('server_error', f'HTTP {response.status}', True)
+        elif failure is None and len(response.body) < self.MIN_INDEX_BODY:
+            failure = ('empty_response', 'Response body too small', True)
+
+        if failure:
+            error_type, error_msg, retryable = failure
+            log = self.logger.error if retryable else self.logger.warning
+            log(f"✗ Species {species_id}: {error_msg} (status {response.status})")
+            if self._save_pipeline:
+                self._save_pipeline.mark_failed(species_id, error_type=error_type,
+                                                error_msg=error_msg, retryable=retryable)
+            self.release_species(species_id)
             return
 
-        # Initialize the species item
-        species_data = SpeciesItem()
-        species_data["species_id"] = species_id
-        species_data["url"] = response.url
-        species_data["scraped_at"] = datetime.utcnow().isoformat() + "Z"
-
-        # Extract basic info
-        species_data["basic_info"] = self.extract_basic_info(response)
-
-        # Extract images
-        species_data["images"] = self.extract_images(response)
-
-        # Extract collection metadata
-        species_data["collection_metadata"] = self.extract_collection_metadata(response)
-
-        # Initialize nested structures
-        species_data["description"] = {}
-        species_data["ecology"] = {}
-        species_data["human_uses"] = {}
-        species_data["conservation"] = {}
-        species_data["nomenclature"] = {}
+        # Initialize the species item (nested sections default to empty dicts)
+        species_data = SpeciesItem(
+            species_id=species_id,
+            url=response.url,
+            scraped_at=datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+            # Extract basic info
+            basic_info=self.extract_basic_info(response),
+            # Extract images
+            images=self.extract_images(response),
+            # Extract collection metadata
+            collection_metadata=self.extract_collection_metadata(response),
+        )
 
         # Extract available sections from menu to know what to expect
         available_sections = self.extract_available_menu_sections(response)
         self.available_sections[species_id] = available_sections
         self.logger.info(f"Species {species_id}: Found {len(available_sections)} available sections in menu: {available_sections}")
+        if not available_sections:
+            # No content pages will be requested, so nothing will finish this species
+            self.release_species(species_id)
+            return
 
-        # Store initial data in meta for aggregation
-        meta = {"species_data": dict(species_data)}
-
-        # Only scrape pages that are actually in the menu (available_sections)
-        # Scrape nomenclature page if available
-        if 'nomenclature._complete' in available_sections:
-            url = f"{self.base_url}/contents/nomenclature.php?id={species_id}"
-            yield scrapy.Request(
-                url,
-                callback=self.parse_nomenclature,
-                meta=meta.copy(),
-                errback=self.handle_error,
-                dont_filter=True
-            )
-
-        # Scrape description pages (only those in menu)
-        for section_name, page_url in self.CONTENT_PAGES["description"].items():
-            if f"description.{section_name}" in available_sections:
-                url = f"{self.base_url}/{page_url}?id={species_id}"
-                meta_copy = meta.copy()
-                meta_copy["section"] = "description"
-                meta_copy["subsection"] = section_name
-                yield scrapy.Request(
-                    url, callback=self.parse_content_page, meta=meta_copy,
-                    errback=self.handle_error, dont_filter=True
-                )
-
-        # Scrape ecology pages (only those in menu)
-        for section_name, page_url in self.CONTENT_PAGES["ecology"].items():
-            # Special handling for combined ecology-distribution page
-            if section_name == "ecology_distribution":
-                if "ecology.distribution" in available_sections:
-                    url = f"{self.base_url}/{page_url}?id={species_id}"
-                    meta_copy = meta.copy()
-                    meta_copy["section"] = "ecology"
-                    meta_copy["subsection"] = "ecology_distribution"
-                    yield scrapy.Request(
-                        url, callback=self.parse_ecology_distribution, meta=meta_copy,
-                        errback=self.handle_error, dont_filter=True
-                    )
-            elif f"ecology.{section_name}" in available_sections:
-                url = f"{self.base_url}/{page_url}?id={species_id}"
-                meta_copy = meta.copy()
-                meta_copy["section"] = "ecology"
-                meta_copy["subsection"] = section_name
-                yield scrapy.Request(
-                    url, callback=self.parse_content_page, meta=meta_copy,
-                    errback=self.handle_error, dont_filter=True
-                )
-
-        # Scrape human uses pages (only those in menu)
-        for section_name, page_url in self.CONTENT_PAGES["human_uses"].items():
-            if f"human_uses.{section_name}" in available_sections:
-                url = f"{self.base_url}/{page_url}?id={species_id}"
-                meta_copy = meta.copy()
-                meta_copy["section"] = "human_uses"
-                meta_copy["subsection"] = section_name
-                yield scrapy.Request(
-                    url, callback=self.parse_content_page, meta=meta_copy,
-                    errback=self.handle_error, dont_filter=True
-                )
+        # Keep the initial data on the spider for aggregation; content pages go through their own slot
+        self._species_cache[species_id] = species_data
+        meta = {"species_id": species_id, "download_slot": self.SUBPAGE_SLOT}
 
-        # Scrape conservation pages (only those in menu)
-        for section_name, page_url in self.CONTENT_PAGES["conservation"].items():
-            if f"conservation.{section_name}" in available_sections:
-                url = f"{self.base_url}/{page_url}?id={species_id}"
-                meta_copy = meta.copy()
-                meta_copy["section"] = "conservation"
-                meta_copy["subsection"] = section_name
+        # Only scrape pages that are actually in the menu (available_sections); each URL is
+        # unique per id=, so the dupefilter only ever drops accidental re-sends
+        for section, subsection, section_key, callback, url_template in self._content_requests:
+            if section_key in available_sections:
                 yield scrapy.Request(
-                    url, callback=self.parse_content_page, meta=meta_copy,
-                    errback=self.handle_error, dont_filter=True
+                    url_template % species_id, callback=callback,
+                    meta={**meta, "section": section, "subsection": subsection},
+                    errback=self.handle_error
                 )
 
     def parse_content_page(self, response):
@@ -369,47 +558,51 @@ class SpeciesSpider(scrapy.Spider):
         """
         section = response.meta["section"]
         subsection = response.meta["subsection"]
-        species_data = response.meta["species_data"]
+        species_data = self._species_cache.get(response.meta["species_id"])
+        if species_data is None:
+            return  # Species already finished - nothing left to aggregate into
 
         # Extract content using generic extractor
         content = self.extract_content_section(response)
 
-        # Store in appropriate section
-        species_data[section][subsection] = content
-
-        # Yield partial data - pipeline will aggregate
-        yield SpeciesItem(species_data)
+        # Yield partial data with just this section - pipeline will aggregate
+        yield replace(species_data, **{section: {subsection: content}})
 
     def parse_nomenclature(self, response):
         """
         Parse nomenclature page (different structure than content pages)
         """
-        species_data = response.meta["species_data"]
+        species_data = self._species_cache.get(response.meta["species_id"])
+        if species_data is None:
+            return  # Species already finished - nothing left to aggregate into
 
         # Extract nomenclature data
-        species_data["nomenclature"] = self.extract_nomenclature(response)
+        nomenclature = self.extract_nomenclature(response)
 
         # Yield partial data - pipeline will aggregate
-        yield SpeciesItem(species_data)
+        yield replace(species_data, nomenclature=nomenclature)
 
     def parse_ecology_distribution(self, response):
         """
         Parse combined ecology-distribution page (has both ecology and distribution in one page)
         """
-        species_data = response.meta["species_data"]
+        species_data = self._species_cache.get(response.meta["species_id"])
+        if species_data is None:
+            return  # Species already finished - nothing left to aggregate into
 
         # Extract ecology and distribution separately from the same page
         ecology_data = self.extract_ecology_from_combined_page(response)
         distribution_data = self.extract_distribution_from_combined_page(response)
 
         # Store both sections
+        ecology = {}
         if ecology_data:
-            species_data["ecology"]["ecology"] = ecology_data
+            ecology["ecology"] = ecology_data
         if distribution_data:
-            species_data["ecology"]["distribution"] = distribution_data
+            ecology["distribution"] = distribution_data
 
         # Yield partial data - pipeline will aggregate
-        yield SpeciesItem(species_data)
+        yield replace(species_data, ecology=ecology)
 
     # ========== Extraction Methods ==========
 
@@ -418,71 +611,29 @@ class SpeciesSpider(scrapy.Spider):
         Extract which sections are actually available for this species from the menu.
         Returns a set of section keys like 'description.habit', 'nomenclature._complete', etc.
         """
-        available = set()
-
-        # Check for Nomenclature
-        if response.css('div#plant_menu[title="Nomenclature"] a'):
-            available.add('nomenclature._complete')
-
-        # Check for Description subsections
-        desc_menu_items = {
-            'Habit': 'habit',
-            'Leaf': 'leaf',
-            'Flower': 'flower',
-            'Fruit': 'fruit',
-            'Seed': 'seed',
-            'Stem': 'stem_bark',
-        }
-        for title, key in desc_menu_items.items():
-            if response.css(f'div#plant_sousmenu[title="{title}"] a'):
-                available.add(f'description.{key}')
-
-        # Check for Ecology sections
-        if response.css('div#plant_menu[title="Phenology"] a'):
-            available.add('ecology.phenology')
-        if response.css('div#plant_menu[title="Reproduction"] a'):
-            available.add('ecology.reproduction_dispersal')
-        if response.css('div#plant_menu[title="Ecology"]'):
-            available.add('ecology.distribution')
-
-        # Check for Human uses subsections
-        human_uses_items = {
-            'Medicinal': 'medicinal',
-            'Culinary': 'culinary',
-            'Handicrafts': 'handicrafts',
-            'Veterinary': 'veterinary',
-            'Others': 'others',
-        }
-        for title, key in human_uses_items.items():
-            # Medicinal can be either a link or selected (span)
-            if response.css(f'div#plant_sousmenu[title="{title}"] a') or \
-               response.css(f'div#plant_sousmenu[title="{title}"] span.subselected'):
-                available.add(f'human_uses.{key}')
-
-        # Check for Conservation sections
-        if response.css('div#plant_menu[title="Conservation status"] a'):
-            available.add('conservation.status')
-        if response.css('div#plant_menu[title="Reforestation"] a'):
-            available.add('conservation.reforestation')
-
-        return available
+        # One query for the available entries, then a dict lookup each instead of a query per section
+        entries = (
+            (node.attrib.get('id'), node.attrib.get('title'))
+            for node in response.xpath(self.XP_MENU_AVAILABLE)
+        )
+        return {self.MENU_SECTIONS[entry] for entry in entries if entry in self.MENU_SECTIONS}
 
     def extract_species_id(self, url):
         """Extract species ID from URL"""
-        match = re.search(r"id=(\d+)", url)
+        match = _ID_RE.search(url)
         return int(match.group(1)) if match else None
 
     def extract_basic_info(self, response):
         """Extract basic species information from index page"""
-        scientific_name = response.css("div#specimen_title::text").get()
+        scientific_name = response.xpath(self.XP_SCIENTIFIC_NAME).get()
         if scientific_name:
             scientific_name = scientific_name.strip()
 
-        authority = response.css("div#specimen_title span.specimen_title2::text").get()
+        authority = response.xpath(self.XP_AUTHORITY).get()
         if authority:
             authority = authority.strip()
 
-        family = response.css("div#specimen_family::text").get()
+        family = response.xpath(self.XP_FAMILY).get()
         if family:
             family = family.strip()
 
@@ -494,10 +645,8 @@ class SpeciesSpider(scrapy.Spider):
 
     def extract_images(self, response):
         """Extract main images from index page"""
-        main_specimen = response.css(
-            "div#specimen_wrapper div#specimen_img img::attr(src)"
-        ).get()
-        dry_herbarium = response.css("div#dryherbarium-img img::attr(src)").get()
+        main_specimen = response.xpath(self.XP_MAIN_SPECIMEN).get()
+        dry_herbarium = response.xpath(self.XP_DRY_HERBARIUM).get()
 
         return {
             "main_specimen": main_specimen,
@@ -516,9 +665,7 @@ class SpeciesSpider(scrapy.Spider):
         collected_by = self.extract_note_content(response, "Collected by")
 
         # GPS coordinates
-        gps_raw = response.css(
-            'div#notes_title:contains("GPS") + div#notes_content pre::text'
-        ).get()
+        gps_raw = response.xpath(self.XP_GPS).get()
         gps_coords = self.parse_gps_coordinates(gps_raw) if gps_raw else None
 
         # Locality
@@ -533,9 +680,7 @@ class SpeciesSpider(scrapy.Spider):
 
     def extract_note_content(self, response, title):
         """Helper to extract content following a notes title"""
-        content = response.xpath(
-            f'//div[@id="notes_title"][contains(text(), "{title}")]/following-sibling::div[@id="notes_content"][1]/text()'
-        ).get()
+        content = response.xpath(self.XP_NOTE_CONTENT, title=title).get()
         return content.strip() if content else None
 
     def parse_gps_coordinates(self, raw_coords):
@@ -564,7 +709,7 @@ class SpeciesSpider(scrapy.Spider):
         text_parts = response.css(
             "div#plant_txt p *::text, div#plant_txt p::text"
         ).getall()
-        text_clean = " ".join([t.strip() for t in text_parts if t.strip()])
+        text_clean = " ".join(t for t in map(str.strip, text_parts) if t)
 
         # Extract images with captions
         images = self.extract_images_with_captions(response)
@@ -598,21 +743,27 @@ class SpeciesSpider(scrapy.Spider):
 
         return images
 
+    def _titchap_text(self, response, title):
+        """
+        Text of the paragraphs after a titchap heading, one stripped text node at a time.
+        lxml's itertext walks each <p> in C; XPath string() would also do that but glues
+        text nodes together with no separator ("Australia.Acacia" across a <br>)
+        """
+        return " ".join(
+            t for p in response.xpath(self.XP_TITCHAP_P, title=title)
+            for t in map(str.strip, p.root.itertext()) if t
+        )
+
     def extract_ecology_from_combined_page(self, response):
         """
         Extract ecology section from the combined ecology-distribution page
         """
         # Extract content from the "Ecology :" section
         # The HTML has <p><li><span class="titchap">Ecology :</span><br><p>content</p></li></p>
-        ecology_text_parts = response.xpath(
-            '//span[@class="titchap" and contains(text(), "Ecology")]/following-sibling::p//text()'
-        ).getall()
-        ecology_text = " ".join([t.strip() for t in ecology_text_parts if t.strip()])
+        ecology_text = self._titchap_text(response, "Ecology")
 
         # Extract HTML - get the parent li element
-        ecology_html = response.xpath(
-            '//span[@class="titchap" and contains(text(), "Ecology")]/parent::li'
-        ).get()
+        ecology_html = response.xpath(self.XP_TITCHAP_LI, title="Ecology").get()
 
         # Extract images (if any in this section)
         images = []
@@ -628,15 +779,10 @@ class SpeciesSpider(scrapy.Spider):
         Extract distribution section from the combined ecology-distribution page
         """
         # Extract content from the "Distribution :" section
-        distribution_text_parts = response.xpath(
-            '//span[@class="titchap" and contains(text(), "Distribution")]/following-sibling::p//text()'
-        ).getall()
-        distribution_text = " ".join([t.strip() for t in distribution_text_parts if t.strip()])
+        distribution_text = self._titchap_text(response, "Distribution")
 
         # Extract HTML - get the parent li element
-        distribution_html = response.xpath(
-            '//span[@class="titchap" and contains(text(), "Distribution")]/parent::li'
-        ).get()
+        distribution_html = response.xpath(self.XP_TITCHAP_LI, title="Distribution").get()
 
         # Extract images (if any in this section)
         images = []
@@ -651,69 +797,68 @@ class SpeciesSpider(scrapy.Spider):
         """
         Extract nomenclature data (has different structure than content pages)
         """
-        # Extract list items with titchap labels
-        botanical_name = response.xpath(
-            '//li[contains(., "Botanical name")]/em/text()'
-        ).get()
+        # Find every labelled list item in one query, keyed by label ("Indian names (phonetics)" -> "Indian names")
+        items = {}
+        for li in response.xpath(self.XP_NOMEN_ITEMS):
+            li = li.root
+            label = li.find("span").text or ""
+            label = label.split(":")[0].split("(")[0].strip()
+            items.setdefault(label, li)
 
-        author = response.xpath('//li[contains(., "Author")]/p/text()').get()
+        li = items.get("Botanical name")
+        botanical_name = li.findtext("em") if li is not None else None
 
-        family = response.xpath(
-            '//li[contains(., "Family")]//text()[not(parent::span)]'
-        ).getall()
+        li = items.get("Author")
+        author = li.findtext("p") if li is not None else None
+
+        li = items.get("Family")
         family = " ".join(
-            [t.strip() for t in family if t.strip() and "Family" not in t]
-        )
+            t for t in map(str.strip, _text_outside_spans(li)) if t and "Family" not in t
+        ) if li is not None else None
 
-        english_names = response.xpath(
-            '//li[contains(., "English names")]//text()[not(parent::span)]'
-        ).getall()
+        li = items.get("English names")
         english_names = " ".join(
-            [t.strip() for t in english_names if t.strip() and "English names" not in t]
-        )
+            t for t in map(str.strip, _text_outside_spans(li)) if t and "English names" not in t
+        ) if li is not None else None
+
+        # Parse Indian names into structured dictionary: {"Hindi": ["name1", "name2"], "Tamil": ["name3"]}
+        # in one pass over the text nodes - each "Language :" marker starts a new group,
+        # and the text up to the next marker holds that language's comma-separated names
+        li = items.get("Indian names")
+        groups = []  # (language, [text, ...]) in page order
+        if li is not None:
+            for text in map(str.strip, _text_outside_spans(li)):
+                if not text or text == "&nbsp;":
+                    continue
+                # parts: [text before the first marker, language, text after it, language, ...]
+                parts = _LANG_RE.split(text)
+                if groups:
+                    groups[-1][1].append(parts[0])
+                for i in range(1, len(parts), 2):
+                    groups.append((parts[i], [parts[i + 1]]))
 
-        # Parse Indian names into structured dictionary
-        indian_names_raw = response.xpath(
-            '//li[contains(., "Indian names")]//text()[not(parent::span)]'
-        ).getall()
-
-        # Join all text parts and clean
-        indian_names_text = " ".join(
-            [t.strip() for t in indian_names_raw if t.strip() and t.strip() != "&nbsp;"]
-        )
-
-        # Parse into dictionary: {"Hindi": ["name1", "name2"], "Tamil": ["name3"]}
         indian_names = {}
-        if indian_names_text:
-            # Split by language markers (e.g., "Hindi :", "Tamil :")
-            import re
-
-            # Pattern: Language name followed by colon
-            parts = re.split(r"([A-Z][a-z]+)\s*:", indian_names_text)
-
-            # parts will be like: ['', 'Hindi', 'Peeli kaner', 'Marathi', 'Bitti', 'Tamil', 'Arali, ponnarali']
-            for i in range(1, len(parts), 2):
-                if i + 1 < len(parts):
-                    language = parts[i].strip()
-                    names_str = parts[i + 1].strip()
-                    # Split by comma to get individual names
-                    names_list = [
-                        name.strip() for name in names_str.split(",") if name.strip()
-                    ]
-                    if names_list:
-                        indian_names[language] = names_list
+        for language, texts in groups:
+            # Split by comma to get individual names
+            names_list = list(filter(None, map(str.strip, " ".join(texts).split(","))))
+            if names_list:
+                indian_names[language] = names_list
 
         # Synonyms - extract all italic text
-        synonyms_list = response.xpath(
-            '//li[contains(., "Synonyms")]//p/i/text()'
-        ).getall()
+        li = items.get("Synonyms")
+        synonyms_list = [
+            t for p in li.iter("p") for i in p.findall("i") for t in _own_text(i)
+        ] if li is not None else []
 
         # Etymology - keep HTML for formatting
-        etymology_html = response.xpath('//li[contains(., "Etymology")]//p').get()
-        etymology_text = response.xpath(
-            '//li[contains(., "Etymology")]//p//text()'
-        ).getall()
-        etymology_clean = "\n".join([t.strip() for t in etymology_text if t.strip()])
+        li = items.get("Etymology")
+        paragraphs = list(li.iter("p")) if li is not None else []
+        etymology_html = etree.tostring(
+            paragraphs[0], method="html", encoding="unicode", with_tail=False
+        ) if paragraphs else None
+        etymology_clean = "\n".join(
+            t for p in paragraphs for t in map(str.strip, p.itertext()) if t
+        )
 
         return {
             "botanical_name": botanical_name.strip() if botanical_name else None,
@@ -723,20 +868,22 @@ class SpeciesSpider(scrapy.Spider):
             "indian_names": indian_names
             if indian_names
             else None,  # Already a dict or None
-            "synonyms": [s.strip() for s in synonyms_list if s.strip()],
+            "synonyms": list(filter(None, map(str.strip, synonyms_list))),
             "etymology": etymology_clean if etymology_clean else None,
             "etymology_html": etymology_html,
         }
 
+    def handle_index_error(self, failure):
+        """Handle a failed species index request, then move on to the next species"""
+        self.handle_error(failure)
+        self.release_species(self.extract_species_id(failure.request.url))
+
     def handle_error(self, failure):
         """Handle request failures (network errors, timeouts, etc.)"""
         species_id = self.extract_species_id(failure.request.url)
 
-        # Get pipeline for error tracking
-        try:
-            pipeline = self.crawler.engine.scraper.itemproc.middlewares[1]  # IncrementalSavingPipeline
-        except (AttributeError, IndexError):
-            pipeline = None
+        # Pipeline for error tracking
+        pipeline = self._save_pipeline
 
         # Network/timeout errors are retryable
         error_type = failure.type.__name__ if hasattr(failure, 'type') else 'unknown'
@@ -744,6 +891,6 @@ class SpeciesSpider(scrapy.Spider):
 
         self.logger.error(f"✗ Request failed for species {species_id}: {error_type}")
 
-        if pipeline and hasattr(pipeline, 'mark_failed'):
+        if pipeline:
             pipeline.mark_failed(species_id, error_type='network_error',
                                error_msg=error_msg, retryable=True)